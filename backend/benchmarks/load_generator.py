@@ -0,0 +1,266 @@
+# % benchmarks/load_generator.py %
+"""
+HTTP load generator for the FastAPI app and the NER server.
+
+Endpoints:
+  * news -> POST /api/v1/news/news/             (NER simulator + ontology ingest)
+  * pos  -> POST /api/v1/nlp/pos-tag-sinhala    (Sinhala POS tagging)
+  * ner  -> POST /api/ner                       (Stanford NER server contract)
+
+The FastAPI app and the NER server are separate services, so they take
+separate base URLs: --url for news/pos and --ner-url for ner. Whichever is
+omitted is started locally: the FastAPI app runs under uvicorn on a
+background thread, and the ner endpoint gets the stub from ner_stub.py. The
+local app shares this process (and its GIL) with the load threads, so for
+numbers you intend to compare across machines start the server yourself.
+
+Run from the backend directory:
+    python benchmarks/load_generator.py --endpoint news,pos --concurrency 8 --duration 15
+    python benchmarks/load_generator.py --endpoint news,ner --url http://localhost:8001 --ner-url http://localhost:8000
+"""
+import argparse
+import itertools
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+from _common import (
+    PROJECT_ROOT,
+    RESULTS_DIR,
+    enter_project_root,
+    ensure_pos_model,
+    non_negative_float,
+    positive_float,
+    positive_int,
+    quiet,
+    resolve_user_path,
+)
+from ner_stub import start_ner_stub
+from reporting import (
+    Metrics,
+    add_latency_metrics,
+    add_metric,
+    check_against_baseline,
+    collect_metadata,
+    load_results,
+    print_metrics,
+    save_results,
+)
+import synthetic_data
+
+# --- Configuration ---
+DEFAULT_CONCURRENCY = 8
+DEFAULT_DURATION = 15.0  # seconds
+DEFAULT_WARMUP = 2.0  # seconds
+DEFAULT_PAYLOADS = 500
+REQUEST_TIMEOUT = 30.0
+
+ENDPOINT_PATHS = {
+    "news": "/api/v1/news/news/",
+    "pos": "/api/v1/nlp/pos-tag-sinhala",
+    "ner": "/api/ner",
+}
+
+# Names the NER simulator recognises, so the news path really links entities.
+SIMULATOR_ENTITIES = [("Joe Biden", "Person"), ("White House", "Location"), ("Ukraine", "Location")]
+
+# Options that change what is measured; a baseline run with different values
+# is not comparable. Metrics are named per endpoint, so the endpoint list itself
+# does not have to match.
+COMPARABLE_CONFIG_KEYS = ("url", "ner_url", "concurrency", "duration", "warmup", "payloads", "ner_latency_ms", "seed")
+
+
+def build_payloads(endpoint: str, count: int, seed: int):
+    if endpoint == "pos":
+        return [{"text": text} for text in synthetic_data.generate_sinhala_sentences(count, seed=seed)]
+
+    articles = synthetic_data.generate_articles(count, SIMULATOR_ENTITIES, seed=seed, entities_per_article=3)
+    key = "message" if endpoint == "ner" else "text"
+    return [{key: news_data["text"]} for news_data, _ in articles]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_local_app(seed: int):
+    """
+    Runs app.main:app under uvicorn on a background thread.
+    Returns (base_url, server, pos_model) where pos_model is "trained" or "synthetic".
+    """
+    import uvicorn
+
+    with quiet():
+        from app.main import app
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    # The lifespan hook has run load_pos_model() by now; fall back to the
+    # synthetic model if the trained one is missing so /pos-tag-sinhala answers.
+    pos_model = ensure_pos_model(seed)
+    return f"http://127.0.0.1:{port}", server, pos_model
+
+
+def run_load(url: str, payloads, concurrency: int, duration: float, warmup: float):
+    """
+    Closed-loop load: each worker sends its next request as soon as the
+    previous one returns. Only requests started after the warmup are counted.
+    """
+    payload_cycle = itertools.cycle(payloads)
+    cycle_lock = threading.Lock()
+    results_lock = threading.Lock()
+    latencies, errors = [], []
+
+    started = time.perf_counter()
+    measure_from = started + warmup
+    stop_at = measure_from + duration
+
+    def worker():
+        session = requests.Session()
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            with cycle_lock:
+                payload = next(payload_cycle)
+            try:
+                response = session.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+                ok = response.status_code < 400
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - now
+            if now < measure_from:
+                continue
+            with results_lock:
+                (latencies if ok else errors).append(elapsed)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    measured = time.perf_counter() - measure_from
+    return latencies, len(errors), measured
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP load generator for the News Ontology backend.")
+    parser.add_argument("--endpoint", default="news",
+                        help=f"Comma-separated subset of: {', '.join(ENDPOINT_PATHS)}.")
+    parser.add_argument("--url", help="Base URL of a running FastAPI app (news, pos). Omit to start one locally.")
+    parser.add_argument("--ner-url", help="Base URL of a running NER server (ner). Omit to start the local stub.")
+    parser.add_argument("--concurrency", type=positive_int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--duration", type=positive_float, default=DEFAULT_DURATION, help="Measured seconds per endpoint.")
+    parser.add_argument("--warmup", type=non_negative_float, default=DEFAULT_WARMUP, help="Unmeasured seconds before timing.")
+    parser.add_argument("--payloads", type=positive_int, default=DEFAULT_PAYLOADS, help="Distinct request bodies to cycle.")
+    parser.add_argument("--ner-latency-ms", type=non_negative_float, default=0.0,
+                        help="Fixed delay for the local NER stub, to emulate classifier cost.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/load_<time>.json).")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against.")
+    parser.add_argument("--threshold", type=non_negative_float, default=10.0, help="Percent slowdown that counts as a regression.")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit with status 1 when any metric regresses past the threshold "
+                             "(status 2 if the baseline used different options).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    enter_project_root()
+    endpoints = [name.strip() for name in args.endpoint.split(",") if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINT_PATHS]
+    if unknown:
+        print(f"ERROR: Unknown endpoint(s): {', '.join(unknown)}")
+        sys.exit(2)
+
+    metrics: Metrics = {}
+    local_app = None
+    local_stub = None
+
+    for endpoint in endpoints:
+        if endpoint == "ner" and args.ner_url:
+            base_url = args.ner_url.rstrip("/")
+            target = "external"
+        elif endpoint == "ner":
+            if local_stub is None:
+                local_stub = start_ner_stub(latency_ms=args.ner_latency_ms)
+            base_url = f"http://127.0.0.1:{local_stub.server_address[1]}"
+            target = "ner-stub"
+        elif args.url:
+            base_url = args.url.rstrip("/")
+            target = "external"
+        else:
+            if local_app is None:
+                local_app = start_local_app(args.seed)
+            base_url = local_app[0]
+            target = "local-app"
+
+        url = f"{base_url}{ENDPOINT_PATHS[endpoint]}"
+        print(f"\n--- Load test: {endpoint} ({target}) -> {url} ---")
+        print(f"  {args.concurrency} workers, {args.warmup:.0f}s warmup, {args.duration:.0f}s measured")
+
+        payloads = build_payloads(endpoint, args.payloads, args.seed)
+        # The local app prints for every ingested article; keep that off the console.
+        with quiet():
+            latencies, error_count, measured = run_load(
+                url, payloads, args.concurrency, args.duration, args.warmup
+            )
+
+        total = len(latencies) + error_count
+        add_metric(metrics, f"http.{endpoint}.requests_per_sec", len(latencies) / measured, "req/s")
+        add_metric(metrics, f"http.{endpoint}.error_rate", error_count / total if total else 0.0, "ratio", "lower")
+        add_latency_metrics(metrics, f"http.{endpoint}.latency", latencies)
+        print(f"  {len(latencies)} ok, {error_count} failed")
+
+    if local_app is not None:
+        local_app[1].should_exit = True
+    if local_stub is not None:
+        local_stub.shutdown()
+
+    print("\n--- Results ---")
+    print_metrics(metrics)
+
+    output = resolve_user_path(args.output) if args.output else os.path.join(
+        RESULTS_DIR, f"load_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    config = {
+        "endpoints": endpoints,
+        "url": args.url,
+        "ner_url": args.ner_url,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "payloads": args.payloads,
+        "ner_latency_ms": args.ner_latency_ms,
+        "seed": args.seed,
+    }
+    if "pos" in endpoints:
+        # Only known when the app runs locally; an external server's model is not visible from here.
+        config["pos_model"] = local_app[2] if local_app is not None else "unknown"
+    save_results(output, collect_metadata(PROJECT_ROOT, config), metrics)
+
+    if args.baseline:
+        config_keys = COMPARABLE_CONFIG_KEYS + (("pos_model",) if "pos" in endpoints else ())
+        status = check_against_baseline(
+            load_results(resolve_user_path(args.baseline)), metrics, config, config_keys,
+            args.threshold, args.fail_on_regression,
+        )
+        if status:
+            sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# % benchmarks/ner_stub.py %
+"""
+Local stand-in for the Stanford NER server (stanford-ner/NERServer.java).
+
+Speaks the same contract: POST /api/ner with {"message": "...", "format": "..."}
+and answers {"result": "<inline XML>"}. Entities come from the backend's NER
+simulator, and an optional fixed delay emulates CRF classification cost, so
+load tests can run without Java or the classifier files.
+
+Run standalone:
+    python benchmarks/ner_stub.py --port 8000 --latency-ms 5
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from _common import add_project_root_to_path
+
+# --- Configuration ---
+DEFAULT_PORT = 8000
+NER_PATH = "/api/ner"
+
+# Stanford's 3-class model labels
+STANFORD_LABELS = {
+    "Person": "PERSON",
+    "Organization": "ORGANIZATION",
+    "Location": "LOCATION",
+}
+
+
+def to_inline_xml(text: str) -> str:
+    """
+    Wraps simulated entities in Stanford-style inline XML tags.
+    Needs the `app` package importable (see add_project_root_to_path).
+    """
+    from app.nlp.ner_simulator import simulate_ner
+
+    result = text
+    for name, entity_type in simulate_ner(text):
+        label = STANFORD_LABELS.get(entity_type, "MISC")
+        start = result.lower().find(name.lower())
+        if start == -1:
+            continue
+        end = start + len(name)
+        result = f"{result[:start]}<{label}>{result[start:end]}</{label}>{result[end:]}"
+    return result
+
+
+def make_handler(latency_seconds: float):
+    class NERStubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != NER_PATH:
+                self._send(404, {"error": "Not Found"})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                request = json.loads(self.rfile.read(length).decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                self._send(400, "Invalid JSON format")
+                return
+            if "message" not in request:
+                self._send(400, "Missing 'message' field in request")
+                return
+
+            if latency_seconds:
+                time.sleep(latency_seconds)
+            self._send(200, {"result": to_inline_xml(str(request["message"]))})
+
+        def do_GET(self):
+            self._send(405, "Method Not Allowed. Use POST.")
+
+        def _send(self, status: int, payload):
+            body = (payload if isinstance(payload, str) else json.dumps(payload)).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Per-request logging would dominate a load test; stay quiet.
+            pass
+
+    return NERStubHandler
+
+
+def start_ner_stub(host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Starts the stub on a background thread and returns the server.
+    Port 0 picks a free port; read it back from server.server_address.
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(latency_ms / 1000.0))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Stanford NER server for load testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed delay added to every response.")
+    args = parser.parse_args()
+    add_project_root_to_path()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.latency_ms / 1000.0))
+    print(f"NER stub started on http://{args.host}:{server.server_address[1]}{NER_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("NER stub shutting down...")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
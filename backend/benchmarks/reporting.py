@@ -0,0 +1,176 @@
+# % benchmarks/reporting.py %
+"""
+Result collection, JSON output and baseline comparison shared by
+run_benchmarks.py and load_generator.py.
+
+A results file looks like:
+    {
+      "meta": {...},
+      "metrics": {
+        "ingest.articles_per_sec[scale=1000]": {"value": 412.3, "unit": "articles/s", "better": "higher"},
+        ...
+      }
+    }
+"""
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+Metrics = Dict[str, Dict[str, Any]]
+
+# Absolute rise allowed over a zero baseline before a metric counts as regressed.
+ZERO_BASELINE_TOLERANCE = 1e-3
+
+
+def add_metric(metrics: Metrics, name: str, value: float, unit: str, better: str = "higher") -> None:
+    """Records one metric. `better` is "higher" or "lower"."""
+    metrics[name] = {"value": round(float(value), 6), "unit": unit, "better": better}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; works for any non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def add_latency_metrics(metrics: Metrics, prefix: str, latencies_seconds: List[float]) -> None:
+    """Records mean/p50/p95/p99 in milliseconds for a list of latencies."""
+    if not latencies_seconds:
+        return
+    in_ms = [value * 1000.0 for value in latencies_seconds]
+    add_metric(metrics, f"{prefix}.mean_ms", sum(in_ms) / len(in_ms), "ms", "lower")
+    for pct in (50, 95, 99):
+        add_metric(metrics, f"{prefix}.p{pct}_ms", percentile(in_ms, pct), "ms", "lower")
+
+
+def collect_metadata(project_root: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "config": config,
+    }
+
+
+def save_results(path: str, meta: Dict[str, Any], metrics: Metrics) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "metrics": metrics}, f, indent=2, ensure_ascii=False)
+    print(f"Results written to: {path}")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    current: Metrics, baseline: Metrics, threshold_pct: float, zero_tolerance: float = ZERO_BASELINE_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """
+    Compares every metric present in both runs. `change_pct` is signed so that
+    a positive number is always an improvement, whichever direction is better.
+
+    A zero baseline has no percentage change. For "lower is better" metrics
+    (error rates, for instance) any rise above `zero_tolerance` still counts
+    as a regression.
+    """
+    rows = []
+    for name, entry in current.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["value"]
+        new = entry["value"]
+        if old == 0:
+            change_pct: Optional[float] = None
+            regression = entry["better"] == "lower" and new > zero_tolerance
+        else:
+            raw = (new - old) / abs(old) * 100.0
+            change_pct = raw if entry["better"] == "higher" else -raw
+            regression = change_pct < -threshold_pct
+        rows.append({
+            "metric": name,
+            "baseline": old,
+            "current": new,
+            "unit": entry["unit"],
+            "change_pct": None if change_pct is None else round(change_pct, 2),
+            "regression": regression,
+        })
+    return rows
+
+
+def compare_configs(current: Dict[str, Any], baseline: Dict[str, Any], keys: Iterable[str]) -> List[str]:
+    """Returns the keys whose values differ between the two run configs."""
+    return [key for key in keys if current.get(key) != baseline.get(key)]
+
+
+def print_metrics(metrics: Metrics) -> None:
+    width = max((len(name) for name in metrics), default=0)
+    for name, entry in metrics.items():
+        print(f"  {name:<{width}}  {entry['value']:>14.3f} {entry['unit']}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], threshold_pct: float) -> int:
+    """Prints the comparison table and returns the number of regressions."""
+    if not rows:
+        print("No metrics in common with the baseline.")
+        return 0
+    width = max(len(row["metric"]) for row in rows)
+    print(f"\n--- Baseline comparison (regression threshold: {threshold_pct:.1f}%) ---")
+    for row in rows:
+        change = "   n/a" if row["change_pct"] is None else f"{row['change_pct']:+7.2f}%"
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"  {row['metric']:<{width}}  {row['baseline']:>12.3f} -> {row['current']:>12.3f} "
+            f"{row['unit']:<10} {change}{flag}"
+        )
+    regressions = sum(1 for row in rows if row["regression"])
+    print(f"{regressions} regression(s) found.")
+    return regressions
+
+
+def check_against_baseline(
+    baseline: Dict[str, Any],
+    metrics: Metrics,
+    config: Dict[str, Any],
+    config_keys: Iterable[str],
+    threshold_pct: float,
+    fail_on_regression: bool,
+) -> int:
+    """
+    Prints the comparison with a loaded baseline results file and returns the exit status:
+    1 for regressions under --fail-on-regression, 2 when that flag is set but
+    the runs used different options, 0 otherwise.
+    """
+    baseline_config = baseline.get("meta", {}).get("config", {})
+    mismatched = compare_configs(config, baseline_config, config_keys)
+    if mismatched:
+        print(f"\nWARNING: The baseline was run with different options: {', '.join(mismatched)}")
+        for key in mismatched:
+            print(f"  {key}: baseline={baseline_config.get(key)!r} current={config.get(key)!r}")
+        print("Changes below may come from the options rather than the code.")
+
+    rows = compare_results(metrics, baseline["metrics"], threshold_pct)
+    regressions = print_comparison(rows, threshold_pct)
+    if fail_on_regression and mismatched:
+        print("ERROR: Refusing --fail-on-regression against a baseline with different options.")
+        return 2
+    if fail_on_regression and regressions:
+        return 1
+    return 0
@@ -0,0 +1,318 @@
+# % benchmarks/run_benchmarks.py %
+"""
+In-process benchmarks for the ingest and tagging paths.
+
+Measures, per ontology scale:
+  * seeding throughput (entities/s)
+  * find_or_create latency for existing names (hits) and new names (misses)
+  * add_news_to_ontology throughput (articles/s)
+and once per run:
+  * tag_sinhala_sentence throughput (tokens/s)
+  * startup time (module imports and POS model load, in a fresh interpreter)
+
+Run from the backend directory:
+    python benchmarks/run_benchmarks.py --scales 1000,10000 --baseline benchmarks/results/baseline.json
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from _common import (
+    PROJECT_ROOT,
+    RESULTS_DIR,
+    enter_project_root,
+    ensure_pos_model,
+    non_negative_float,
+    positive_int,
+    positive_int_list,
+    quiet,
+    resolve_user_path,
+)
+from reporting import (
+    Metrics,
+    add_latency_metrics,
+    add_metric,
+    check_against_baseline,
+    collect_metadata,
+    load_results,
+    print_metrics,
+    save_results,
+)
+import synthetic_data
+
+# --- Configuration ---
+BENCH_ONTOLOGY_IRI = "http://bench.news-ontology.local/scale_{scale}#"
+
+DEFAULT_SCALES = "1000,10000,100000"
+DEFAULT_ARTICLES = 200
+DEFAULT_LOOKUPS = 200
+DEFAULT_SENTENCES = 2000
+DEFAULT_STARTUP_REPEATS = 3
+DEFAULT_TIME_BUDGET = 30.0  # seconds per benchmark per scale
+MIN_ITERATIONS = 3
+DEFAULT_REGRESSION_THRESHOLD = 10.0  # percent
+
+# Options that change what each benchmark measures; a baseline run with
+# different values is not comparable.
+COMPARABLE_CONFIG_KEYS = {
+    "ontology": ("scales", "articles", "lookups", "time_budget", "seed"),
+    "pos": ("sentences", "time_budget", "seed", "pos_model"),
+    "startup": ("startup_pos_model_loaded",),
+}
+BENCHMARKS = tuple(COMPARABLE_CONFIG_KEYS)
+
+# Runs in a fresh interpreter so that import and model-load costs are not
+# hidden by modules this process has already imported.
+STARTUP_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import app.core.ontology_manager
+t1 = time.perf_counter()
+import app.main
+t2 = time.perf_counter()
+from app.nlp.sinhala_pos_tagger import load_pos_model
+loaded = load_pos_model()
+t3 = time.perf_counter()
+print(json.dumps({
+    "ontology_import": t1 - t0,
+    "app_import": t2 - t0,
+    "pos_model_load": t3 - t2,
+    "pos_model_loaded": bool(loaded),
+}))
+"""
+
+
+def _within_budget(iterations: int, started: float, budget: float) -> bool:
+    return iterations < MIN_ITERATIONS or time.perf_counter() - started < budget
+
+
+# --- Ontology benchmarks ---
+def seed_ontology(ontology_manager, scale: int, entities):
+    """
+    Creates a scratch ontology in the default world and fills it with `entities`.
+    Individuals are created directly (not through find_or_create) so that
+    seeding 1M entities does not dominate the run.
+    """
+    from owlready2 import default_world
+
+    bench_onto = default_world.get_ontology(BENCH_ONTOLOGY_IRI.format(scale=scale))
+    for i, (name, entity_type) in enumerate(entities):
+        cls = ontology_manager.entity_class_map[entity_type]
+        individual = cls(f"{ontology_manager.sanitize_iri(name)}_{entity_type}_{i}", namespace=bench_onto)
+        individual.hasEntityName.append(name)
+    return bench_onto
+
+
+def run_lookup_benchmark(ontology_manager, bench_onto, entities, samples: int, budget: float, seed: int):
+    rng = random.Random(seed)
+    onto = ontology_manager.onto
+
+    hit_latencies = []
+    started = time.perf_counter()
+    while len(hit_latencies) < samples and _within_budget(len(hit_latencies), started, budget):
+        name, entity_type = rng.choice(entities)
+        t0 = time.perf_counter()
+        ontology_manager.find_or_create(bench_onto, ontology_manager.entity_class_map[entity_type], onto.hasEntityName, name)
+        hit_latencies.append(time.perf_counter() - t0)
+
+    miss_latencies = []
+    started = time.perf_counter()
+    while len(miss_latencies) < samples and _within_budget(len(miss_latencies), started, budget):
+        entity_type = rng.choice(synthetic_data.ENTITY_TYPES)
+        name = f"Unseen {entity_type} {seed}-{len(miss_latencies)}"
+        t0 = time.perf_counter()
+        ontology_manager.find_or_create(bench_onto, ontology_manager.entity_class_map[entity_type], onto.hasEntityName, name)
+        miss_latencies.append(time.perf_counter() - t0)
+
+    return hit_latencies, miss_latencies
+
+
+def run_ingest_benchmark(ontology_manager, bench_onto, entities, articles: int, budget: float, seed: int):
+    ingested = 0
+    elapsed = 0.0
+    started = time.perf_counter()
+    for news_data, simulated_entities in synthetic_data.generate_articles(articles, entities, seed=seed):
+        if not _within_budget(ingested, started, budget):
+            break
+        t0 = time.perf_counter()
+        with quiet():
+            ontology_manager.add_news_to_ontology(bench_onto, news_data, simulated_entities)
+        elapsed += time.perf_counter() - t0
+        ingested += 1
+    return ingested, elapsed
+
+
+def run_ontology_benchmarks(metrics: Metrics, scales, args) -> None:
+    with quiet():
+        from app.core import ontology_manager
+
+    for scale in scales:
+        print(f"\n--- Ontology benchmarks at scale {scale} ---")
+        entities = synthetic_data.generate_entities(scale, seed=args.seed)
+
+        t0 = time.perf_counter()
+        bench_onto = seed_ontology(ontology_manager, scale, entities)
+        seed_elapsed = time.perf_counter() - t0
+        add_metric(metrics, f"seed.entities_per_sec[scale={scale}]", scale / seed_elapsed, "entities/s")
+        print(f"  Seeded {scale} entities in {seed_elapsed:.2f}s")
+
+        try:
+            hits, misses = run_lookup_benchmark(
+                ontology_manager, bench_onto, entities, args.lookups, args.time_budget, args.seed
+            )
+            add_latency_metrics(metrics, f"lookup.hit[scale={scale}]", hits)
+            add_latency_metrics(metrics, f"lookup.miss[scale={scale}]", misses)
+            print(f"  Timed {len(hits)} lookup hits and {len(misses)} misses")
+
+            ingested, elapsed = run_ingest_benchmark(
+                ontology_manager, bench_onto, entities, args.articles, args.time_budget, args.seed
+            )
+            add_metric(metrics, f"ingest.articles_per_sec[scale={scale}]", ingested / elapsed, "articles/s")
+            print(f"  Ingested {ingested} articles in {elapsed:.2f}s")
+        finally:
+            # Drop every triple the scale added so the next scale starts clean.
+            bench_onto.destroy()
+
+
+# --- POS tagging benchmark ---
+def run_pos_benchmark(metrics: Metrics, args) -> str:
+    from app.nlp.sinhala_pos_tagger import tag_sinhala_sentence
+
+    print("\n--- POS tagging benchmark ---")
+    model_source = ensure_pos_model(args.seed)
+    sentences = synthetic_data.generate_sinhala_sentences(args.sentences, seed=args.seed)
+
+    tokens = 0
+    tagged = 0
+    latencies = []
+    started = time.perf_counter()
+    for sentence in sentences:
+        if not _within_budget(tagged, started, args.time_budget):
+            break
+        t0 = time.perf_counter()
+        tokens += len(tag_sinhala_sentence(sentence))
+        latencies.append(time.perf_counter() - t0)
+        tagged += 1
+    elapsed = sum(latencies)
+
+    add_metric(metrics, "pos.tokens_per_sec", tokens / elapsed, "tokens/s")
+    add_metric(metrics, "pos.sentences_per_sec", tagged / elapsed, "sentences/s")
+    add_latency_metrics(metrics, "pos.sentence", latencies)
+    print(f"  Tagged {tagged} sentences ({tokens} tokens) in {elapsed:.2f}s using the {model_source} model")
+    return model_source
+
+
+# --- Startup benchmark ---
+def run_startup_benchmark(metrics: Metrics, repeats: int) -> bool:
+    """
+    Returns whether the trained POS model loaded. A failed load returns at
+    once, so its time is only recorded when the model was actually loaded.
+    """
+    print("\n--- Startup benchmark ---")
+    runs = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-c", STARTUP_PROBE],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        )
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    pos_model_loaded = all(run["pos_model_loaded"] for run in runs)
+    keys = ["ontology_import", "app_import"]
+    if pos_model_loaded:
+        keys.append("pos_model_load")
+    for key in keys:
+        values = sorted(run[key] for run in runs)
+        add_metric(metrics, f"startup.{key}_ms", values[len(values) // 2] * 1000.0, "ms", "lower")
+    print(f"  Median of {repeats} fresh interpreter start(s)")
+    if not pos_model_loaded:
+        print("  No trained POS model found; startup.pos_model_load_ms not recorded")
+    return pos_model_loaded
+
+
+def benchmark_list(value: str):
+    names = sorted({name.strip() for name in value.split(",") if name.strip()})
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if not names or unknown:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated subset of {', '.join(BENCHMARKS)}, got '{value}'"
+        )
+    return names
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ontology ingest and Sinhala POS tagging paths.")
+    parser.add_argument("--scales", type=positive_int_list, default=DEFAULT_SCALES,
+                        help="Comma-separated ontology sizes in entities (e.g. 1000,10000,100000,1000000).")
+    parser.add_argument("--articles", type=positive_int, default=DEFAULT_ARTICLES, help="Articles to ingest per scale.")
+    parser.add_argument("--lookups", type=positive_int, default=DEFAULT_LOOKUPS, help="Hit and miss lookups per scale.")
+    parser.add_argument("--sentences", type=positive_int, default=DEFAULT_SENTENCES, help="Sentences to POS tag.")
+    parser.add_argument("--startup-repeats", type=positive_int, default=DEFAULT_STARTUP_REPEATS)
+    parser.add_argument("--time-budget", type=non_negative_float, default=DEFAULT_TIME_BUDGET,
+                        help="Upper bound in seconds for each timed loop; large scales stop early.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", type=benchmark_list, default=",".join(BENCHMARKS),
+                        help="Comma-separated subset of: ontology, pos, startup.")
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/benchmark_<time>.json).")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against.")
+    parser.add_argument("--threshold", type=non_negative_float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Percent slowdown that counts as a regression.")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit with status 1 when any metric regresses past the threshold "
+                             "(status 2 if the baseline used different options).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    enter_project_root()
+    scales = args.scales
+    selected = set(args.only)
+
+    metrics: Metrics = {}
+    config = {
+        "scales": scales,
+        "articles": args.articles,
+        "lookups": args.lookups,
+        "sentences": args.sentences,
+        "startup_repeats": args.startup_repeats,
+        "time_budget": args.time_budget,
+        "seed": args.seed,
+        "only": sorted(selected),
+    }
+
+    if "ontology" in selected:
+        run_ontology_benchmarks(metrics, scales, args)
+    if "pos" in selected:
+        config["pos_model"] = run_pos_benchmark(metrics, args)
+    if "startup" in selected:
+        config["startup_pos_model_loaded"] = run_startup_benchmark(metrics, args.startup_repeats)
+
+    print("\n--- Results ---")
+    print_metrics(metrics)
+
+    output = resolve_user_path(args.output) if args.output else os.path.join(
+        RESULTS_DIR, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    save_results(output, collect_metadata(PROJECT_ROOT, config), metrics)
+
+    if args.baseline:
+        baseline = load_results(resolve_user_path(args.baseline))
+        # Only options of benchmarks both runs did matter; the rest have no metrics to compare.
+        shared = selected & set(baseline.get("meta", {}).get("config", {}).get("only", BENCHMARKS))
+        config_keys = sorted({key for name in shared for key in COMPARABLE_CONFIG_KEYS[name]})
+        status = check_against_baseline(
+            baseline, metrics, config, config_keys,
+            args.threshold, args.fail_on_regression,
+        )
+        if status:
+            sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# % benchmarks/synthetic_data.py %
+"""
+Deterministic synthetic data for the benchmark suite.
+
+Everything here is generated from a seeded random.Random, so the same seed
+always produces the same entities, articles and sentences. That keeps runs
+comparable against a saved baseline.
+"""
+import random
+from typing import Dict, Iterator, List, Tuple
+
+# --- Vocabulary ---
+ENTITY_TYPES = ["Person", "Organization", "Location"]
+
+ENGLISH_FIRST_NAMES = [
+    "Joe", "Anura", "Kamala", "Ranil", "Mahinda", "Sajith", "Emma", "Liam",
+    "Olivia", "Noah", "Ava", "Elijah", "Nimal", "Sunil", "Chamari", "Dilani",
+]
+ENGLISH_LAST_NAMES = [
+    "Biden", "Perera", "Fernando", "Silva", "Jayasuriya", "Smith", "Johnson",
+    "Brown", "Wickramasinghe", "Bandara", "Dissanayake", "Rajapaksa",
+]
+ENGLISH_ORG_SUFFIXES = ["Holdings", "Bank", "Council", "Ministry", "Foundation", "Party", "Group"]
+ENGLISH_LOCATION_SUFFIXES = ["City", "District", "Province", "Harbour", "Valley", "Junction"]
+ENGLISH_FILLER = [
+    "the", "minister", "said", "today", "after", "meeting", "with", "officials",
+    "in", "report", "on", "new", "policy", "announced", "during", "visit", "to",
+]
+
+# Sinhala consonants and dependent vowel signs used to build pseudo-words.
+SINHALA_CONSONANTS = list("කගචජටඩතදනපබමයරලවසහළ")
+SINHALA_VOWEL_SIGNS = ["", "ා", "ි", "ී", "ු", "ූ", "ෙ", "ො"]
+SINHALA_ORG_SUFFIXES = ["සමාගම", "බැංකුව", "සභාව", "අමාත්‍යාංශය", "පක්ෂය"]
+SINHALA_LOCATION_SUFFIXES = ["නගරය", "දිස්ත්‍රික්කය", "පළාත", "වරාය"]
+
+# Small tagged Sinhala lexicon used for POS sentences and the synthetic model.
+SINHALA_TAGGED_LEXICON: List[Tuple[str, str]] = [
+    ("මම", "PRP"), ("ඔහු", "PRP"), ("ඇය", "PRP"), ("අපි", "PRP"),
+    ("ගෙදර", "NNC"), ("පාසල", "NNC"), ("පොත", "NNC"), ("රජය", "NNC"),
+    ("ඇමති", "NNC"), ("ප්‍රවෘත්ති", "NNC"), ("ජනතාව", "NNC"),
+    ("යනවා", "VFM"), ("කියනවා", "VFM"), ("කළා", "VFM"), ("ගියා", "VFM"),
+    ("ලොකු", "JJ"), ("නව", "JJ"), ("හොඳ", "JJ"),
+    ("ඉක්මනින්", "RB"), ("අද", "RB"), ("ඊයේ", "RB"),
+    ("සමඟ", "POST"), ("විසින්", "POST"), ("ගැන", "POST"),
+    ("සහ", "CC"), ("නමුත්", "CC"),
+    ("2024", "NUM"), ("10", "NUM"),
+    (".", "FS"),
+]
+SINHALA_FILLER = [word for word, _ in SINHALA_TAGGED_LEXICON if word != "."]
+
+
+def _sinhala_word(rng: random.Random, min_syllables: int = 2, max_syllables: int = 4) -> str:
+    syllables = rng.randint(min_syllables, max_syllables)
+    return "".join(
+        rng.choice(SINHALA_CONSONANTS) + rng.choice(SINHALA_VOWEL_SIGNS)
+        for _ in range(syllables)
+    )
+
+
+def generate_entity_name(rng: random.Random, entity_type: str, language: str, index: int) -> str:
+    """
+    Builds a single entity name. The index is appended so names stay unique
+    at every scale, which keeps the seeded ontology free of accidental merges.
+    """
+    if language == "si":
+        base = f"{_sinhala_word(rng)} {_sinhala_word(rng)}"
+        if entity_type == "Organization":
+            base = f"{base} {rng.choice(SINHALA_ORG_SUFFIXES)}"
+        elif entity_type == "Location":
+            base = f"{base} {rng.choice(SINHALA_LOCATION_SUFFIXES)}"
+    else:
+        if entity_type == "Person":
+            base = f"{rng.choice(ENGLISH_FIRST_NAMES)} {rng.choice(ENGLISH_LAST_NAMES)}"
+        elif entity_type == "Organization":
+            base = f"{rng.choice(ENGLISH_LAST_NAMES)} {rng.choice(ENGLISH_ORG_SUFFIXES)}"
+        else:
+            base = f"{rng.choice(ENGLISH_LAST_NAMES)} {rng.choice(ENGLISH_LOCATION_SUFFIXES)}"
+    return f"{base} {index}"
+
+
+def generate_entities(count: int, seed: int = 42, sinhala_ratio: float = 0.5) -> List[Tuple[str, str]]:
+    """
+    Returns `count` unique (name, entity_type) tuples in the same shape as the
+    NER simulator output.
+    """
+    rng = random.Random(seed)
+    entities = []
+    for i in range(count):
+        entity_type = ENTITY_TYPES[i % len(ENTITY_TYPES)]
+        language = "si" if rng.random() < sinhala_ratio else "en"
+        entities.append((generate_entity_name(rng, entity_type, language, i), entity_type))
+    return entities
+
+
+def generate_articles(
+    count: int,
+    known_entities: List[Tuple[str, str]],
+    seed: int = 42,
+    entities_per_article: int = 5,
+    new_entity_ratio: float = 0.2,
+    sinhala_ratio: float = 0.5,
+) -> Iterator[Tuple[Dict[str, str], List[Tuple[str, str]]]]:
+    """
+    Yields (news_data, simulated_entities) pairs ready for
+    ontology_manager.add_news_to_ontology.
+
+    Most mentions are drawn from `known_entities` (lookup hits); a
+    `new_entity_ratio` share are fresh names that force a create.
+    """
+    rng = random.Random(seed + 1)
+    new_index = len(known_entities)
+    for _ in range(count):
+        language = "si" if rng.random() < sinhala_ratio else "en"
+        mentions = []
+        for _ in range(entities_per_article):
+            if known_entities and rng.random() >= new_entity_ratio:
+                mentions.append(rng.choice(known_entities))
+            else:
+                entity_type = rng.choice(ENTITY_TYPES)
+                mentions.append((generate_entity_name(rng, entity_type, language, new_index), entity_type))
+                new_index += 1
+
+        filler = SINHALA_FILLER if language == "si" else ENGLISH_FILLER
+        words = []
+        for name, _ in mentions:
+            words.extend(rng.choice(filler) for _ in range(rng.randint(3, 8)))
+            words.append(name)
+        words.extend(rng.choice(filler) for _ in range(rng.randint(3, 8)))
+        yield {"text": " ".join(words) + " ."}, mentions
+
+
+def generate_sinhala_sentences(count: int, seed: int = 42, min_tokens: int = 5, max_tokens: int = 25) -> List[str]:
+    """Returns Sinhala sentences built from the tagged lexicon and pseudo-words."""
+    rng = random.Random(seed + 2)
+    sentences = []
+    for _ in range(count):
+        tokens = []
+        for _ in range(rng.randint(min_tokens, max_tokens)):
+            # Mix in unseen pseudo-words so the model sees out-of-vocabulary tokens too.
+            if rng.random() < 0.2:
+                tokens.append(_sinhala_word(rng))
+            else:
+                tokens.append(rng.choice(SINHALA_FILLER))
+        tokens.append(".")
+        sentences.append(" ".join(tokens))
+    return sentences
+
+
+def generate_tagged_sinhala_sentences(count: int, seed: int = 42) -> List[List[Tuple[str, str]]]:
+    """
+    Returns tagged sentences in the same [(word, tag), ...] shape the training
+    script reads from its CSV, for fitting a stand-in POS model.
+    """
+    rng = random.Random(seed + 3)
+    sentences = []
+    for _ in range(count):
+        sentence = [rng.choice(SINHALA_TAGGED_LEXICON[:-1]) for _ in range(rng.randint(4, 15))]
+        sentence.append(SINHALA_TAGGED_LEXICON[-1])
+        sentences.append(sentence)
+    return sentences
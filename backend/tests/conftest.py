@@ -0,0 +1,10 @@
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.join(BACKEND_DIR, "benchmarks")
+
+# The benchmark scripts import each other as top-level modules and use the `app` package.
+for path in (BACKEND_DIR, BENCHMARKS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
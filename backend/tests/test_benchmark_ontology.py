@@ -0,0 +1,51 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+pytest.importorskip("owlready2")
+
+import synthetic_data  # noqa: E402
+from run_benchmarks import seed_ontology  # noqa: E402
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def ontology_manager():
+    # ontology_manager loads data/news_ontology_interactive.owl relative to the working directory.
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(BACKEND_DIR)
+        with contextlib.redirect_stdout(io.StringIO()):
+            from app.core import ontology_manager
+    return ontology_manager
+
+
+def test_seeded_entities_are_found_and_destroy_cleans_up(ontology_manager):
+    from owlready2 import default_world
+
+    onto = ontology_manager.onto
+    entities = synthetic_data.generate_entities(30, seed=11)
+    persons_before = len(list(onto.Person.instances()))
+
+    bench_onto = seed_ontology(ontology_manager, 30, entities)
+    try:
+        seeded = list(bench_onto.individuals())
+        assert len(seeded) == len(entities)
+
+        for name, entity_type in entities:
+            cls = ontology_manager.entity_class_map[entity_type]
+            found = ontology_manager.find_or_create(bench_onto, cls, onto.hasEntityName, name)
+            assert found in seeded
+            assert found.hasEntityName.first() == name
+            assert isinstance(found, cls)
+
+        # Every lookup was a hit, so nothing new was created.
+        assert len(list(bench_onto.individuals())) == len(entities)
+    finally:
+        bench_onto.destroy()
+
+    assert len(list(onto.Person.instances())) == persons_before
+    for name, _ in entities:
+        assert default_world.search_one(hasEntityName=name) is None
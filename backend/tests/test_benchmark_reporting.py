@@ -0,0 +1,122 @@
+from reporting import (
+    add_metric,
+    check_against_baseline,
+    compare_configs,
+    compare_results,
+    load_results,
+    percentile,
+    save_results,
+)
+
+
+def _metrics(**values):
+    metrics = {}
+    for name, (value, better) in values.items():
+        add_metric(metrics, name, value, "unit", better)
+    return metrics
+
+
+def test_percentile_nearest_rank():
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == 5.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_percentile_p99_of_hundred_values():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 50) == 50.0
+
+
+def test_compare_higher_is_better_drop_is_regression():
+    baseline = _metrics(throughput=(100.0, "higher"))
+    current = _metrics(throughput=(80.0, "higher"))
+    [row] = compare_results(current, baseline, threshold_pct=10.0)
+    assert row["change_pct"] == -20.0
+    assert row["regression"]
+
+
+def test_compare_lower_is_better_sign_is_flipped():
+    baseline = _metrics(latency=(10.0, "lower"))
+
+    [slower] = compare_results(_metrics(latency=(12.0, "lower")), baseline, threshold_pct=10.0)
+    assert slower["change_pct"] == -20.0
+    assert slower["regression"]
+
+    [faster] = compare_results(_metrics(latency=(8.0, "lower")), baseline, threshold_pct=10.0)
+    assert faster["change_pct"] == 20.0
+    assert not faster["regression"]
+
+
+def test_compare_within_threshold_is_not_regression():
+    baseline = _metrics(latency=(10.0, "lower"))
+    [row] = compare_results(_metrics(latency=(10.5, "lower")), baseline, threshold_pct=10.0)
+    assert not row["regression"]
+
+
+def test_compare_zero_baseline_lower_is_better():
+    baseline = _metrics(error_rate=(0.0, "lower"))
+
+    [jump] = compare_results(_metrics(error_rate=(0.5, "lower")), baseline, threshold_pct=10.0)
+    assert jump["change_pct"] is None
+    assert jump["regression"]
+
+    [still_zero] = compare_results(_metrics(error_rate=(0.0, "lower")), baseline, threshold_pct=10.0)
+    assert not still_zero["regression"]
+
+
+def test_compare_zero_baseline_higher_is_better_never_regresses():
+    baseline = _metrics(throughput=(0.0, "higher"))
+    [row] = compare_results(_metrics(throughput=(5.0, "higher")), baseline, threshold_pct=10.0)
+    assert not row["regression"]
+
+
+def test_compare_skips_metrics_missing_from_baseline():
+    baseline = _metrics(a=(1.0, "higher"))
+    current = _metrics(a=(1.0, "higher"), b=(2.0, "higher"))
+    assert [row["metric"] for row in compare_results(current, baseline, threshold_pct=10.0)] == ["a"]
+
+
+def test_compare_configs_reports_differing_keys():
+    baseline = {"concurrency": 8, "duration": 15.0, "seed": 42}
+    current = {"concurrency": 4, "duration": 15.0, "seed": 42}
+    assert compare_configs(current, baseline, ("concurrency", "duration", "seed")) == ["concurrency"]
+    assert compare_configs(baseline, baseline, ("concurrency", "duration", "seed")) == []
+
+
+def _baseline(tmp_path, config, metrics):
+    path = str(tmp_path / "baseline.json")
+    save_results(path, {"config": config}, metrics)
+    return load_results(path)
+
+
+def test_check_against_baseline_passes_on_matching_run(tmp_path):
+    config = {"concurrency": 8, "seed": 42}
+    baseline = _baseline(tmp_path, config, _metrics(throughput=(100.0, "higher")))
+    status = check_against_baseline(
+        baseline, _metrics(throughput=(99.0, "higher")), config, ("concurrency", "seed"), 10.0, True
+    )
+    assert status == 0
+
+
+def test_check_against_baseline_regression_exit_status(tmp_path):
+    config = {"concurrency": 8, "seed": 42}
+    baseline = _baseline(tmp_path, config, _metrics(throughput=(100.0, "higher")))
+    current = _metrics(throughput=(50.0, "higher"))
+
+    assert check_against_baseline(baseline, current, config, ("concurrency", "seed"), 10.0, True) == 1
+    # Without --fail-on-regression the regression is only reported.
+    assert check_against_baseline(baseline, current, config, ("concurrency", "seed"), 10.0, False) == 0
+
+
+def test_check_against_baseline_refuses_mismatched_options(tmp_path):
+    baseline = _baseline(tmp_path, {"concurrency": 8, "seed": 42}, _metrics(throughput=(100.0, "higher")))
+    current_config = {"concurrency": 4, "seed": 42}
+    current = _metrics(throughput=(50.0, "higher"))
+
+    assert check_against_baseline(baseline, current, current_config, ("concurrency", "seed"), 10.0, True) == 2
+    assert check_against_baseline(baseline, current, current_config, ("concurrency", "seed"), 10.0, False) == 0
+    # Keys that are not compared do not count as a mismatch.
+    assert check_against_baseline(baseline, current, current_config, ("seed",), 10.0, True) == 1
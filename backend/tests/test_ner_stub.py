@@ -0,0 +1,18 @@
+from ner_stub import to_inline_xml
+
+
+def test_to_inline_xml_tags_simulated_entities():
+    result = to_inline_xml("Joe Biden met officials at the White House about Ukraine .")
+    assert result == (
+        "<PERSON>Joe Biden</PERSON> met officials at the "
+        "<LOCATION>White House</LOCATION> about <LOCATION>Ukraine</LOCATION> ."
+    )
+
+
+def test_to_inline_xml_keeps_original_casing():
+    assert to_inline_xml("talks in ukraine") == "talks in <LOCATION>ukraine</LOCATION>"
+
+
+def test_to_inline_xml_without_entities_is_unchanged():
+    text = "ඔහු අද පාසල ගියා ."
+    assert to_inline_xml(text) == text
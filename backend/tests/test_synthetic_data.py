@@ -0,0 +1,37 @@
+import synthetic_data
+
+
+def test_entities_are_deterministic_for_a_seed():
+    assert synthetic_data.generate_entities(200, seed=7) == synthetic_data.generate_entities(200, seed=7)
+    assert synthetic_data.generate_entities(200, seed=7) != synthetic_data.generate_entities(200, seed=8)
+
+
+def test_entities_are_unique_and_typed():
+    entities = synthetic_data.generate_entities(500, seed=1)
+    assert len(entities) == 500
+    assert len({name for name, _ in entities}) == 500
+    assert {entity_type for _, entity_type in entities} == set(synthetic_data.ENTITY_TYPES)
+
+
+def test_articles_are_deterministic_for_a_seed():
+    entities = synthetic_data.generate_entities(50, seed=3)
+    first = list(synthetic_data.generate_articles(20, entities, seed=3))
+    second = list(synthetic_data.generate_articles(20, entities, seed=3))
+    assert first == second
+    for news_data, mentions in first:
+        assert news_data["text"]
+        assert len(mentions) == 5
+        for name, _ in mentions:
+            assert name in news_data["text"]
+
+
+def test_sentences_are_deterministic_for_a_seed():
+    first = synthetic_data.generate_sinhala_sentences(30, seed=5)
+    assert first == synthetic_data.generate_sinhala_sentences(30, seed=5)
+    assert all(sentence.endswith(" .") for sentence in first)
+
+
+def test_tagged_sentences_match_training_shape():
+    for sentence in synthetic_data.generate_tagged_sinhala_sentences(10, seed=2):
+        assert sentence[-1] == (".", "FS")
+        assert all(isinstance(word, str) and isinstance(tag, str) for word, tag in sentence)